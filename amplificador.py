@@ -1,37 +1,58 @@
+import sys
 import math
-import cmath
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
 
+_TWO_PI = 2.0 * math.pi
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT2 = 1.0 / _SQRT2  # multiplicar es más barato que dividir
+
 # ------------------------------
 # Funciones auxiliares de entrada
 # ------------------------------
 
-def leer_float(mensaje):
+def _leer(mensaje, convertir, error, validar=None, error_validacion=None):
+    """
+    Lee líneas de la entrada estándar hasta obtener un valor válido:
+    convertir(línea) no debe lanzar ValueError y, si se indica,
+    validar(valor) debe ser verdadero. Muestra el error correspondiente
+    antes de volver a preguntar.
+    """
     while True:
+        sys.stdout.write(mensaje)
+        sys.stdout.flush()
+        linea = sys.stdin.readline()
+        if not linea:
+            raise EOFError("Se terminó la entrada estándar.")
+
         try:
-            valor = float(input(mensaje))
-            return valor
+            valor = convertir(linea)
         except ValueError:
-            print("Entrada inválida. Por favor ingrese un número.")
+            print(error)
+            continue
+
+        if validar is not None and not validar(valor):
+            print(error_validacion)
+            continue
+
+        return valor
+
+
+def leer_float(mensaje):
+    return _leer(mensaje, float, "Entrada inválida. Por favor ingrese un número.")
 
 
 def leer_int(mensaje):
-    while True:
-        try:
-            valor = int(input(mensaje))
-            return valor
-        except ValueError:
-            print("Entrada inválida. Por favor ingrese un número entero.")
+    return _leer(mensaje, int, "Entrada inválida. Por favor ingrese un número entero.")
 
 
 def leer_int_rango(mensaje, minimo, maximo):
-    while True:
-        valor = leer_int(mensaje)
-        if minimo <= valor <= maximo:
-            return valor
-        else:
-            print(f"Por favor ingrese un valor entre {minimo} y {maximo}.")
+    return _leer(
+        mensaje, int, "Entrada inválida. Por favor ingrese un número entero.",
+        lambda valor: minimo <= valor <= maximo,
+        f"Por favor ingrese un valor entre {minimo} y {maximo}."
+    )
 
 
 # ---------------------------------
@@ -117,7 +138,7 @@ def pedir_senal():
         tipo_amp = leer_int_rango("Opción: ", 1, 2)
 
         if tipo_amp == 1:
-            A1_rms = A1 / math.sqrt(2.0)
+            A1_rms = A1 * _INV_SQRT2
         else:
             A1_rms = A1
 
@@ -145,7 +166,7 @@ def pedir_senal():
             tipo_ampk = leer_int_rango("  Opción: ", 1, 2)
 
             if tipo_ampk == 1:
-                Ak_rms = Ak / math.sqrt(2.0)
+                Ak_rms = Ak * _INV_SQRT2
             else:
                 Ak_rms = Ak
 
@@ -168,82 +189,131 @@ def pedir_senal():
 # Modelo del amplificador H(ω)
 # ---------------------------------------
 
+def _raices_cuadratica(b, c):
+    """Raíces de ω² + bω + c (para factorizar los denominadores)."""
+    disc = (b * b - 4 * c) ** 0.5
+    return (-b + disc) / 2, (-b - disc) / 2
+
+
+# Coeficientes de H(ω) por región, precalculados: nunca cambian.
+# Bajas:  H = (Aω + B) / ((ω - r1)(ω - r2))
+_BAJAS_A = -13.03j
+_BAJAS_B = -13.03 * -0.6143
+_BAJAS_R1, _BAJAS_R2 = _raices_cuadratica(-23.55j, -79.68)
+
+# Medias: H = Aω² / ((ω - r1)(ω - r2))
+_MEDIAS_A = -43.03
+_MEDIAS_R1, _MEDIAS_R2 = _raices_cuadratica(-22.94j, -73.48)
+
+# Altas:  H = ω² (0.4ω + 8.61e10 j) / (ω³ - 2e9 j ω² - 4.69e10 ω + 1.41e11 j),
+#         denominador en forma de Horner
+_ALTAS_A = 0.4
+_ALTAS_B = 8.61e10j
+_ALTAS_D2 = -2e9j
+_ALTAS_D1 = -4.69e10
+_ALTAS_D0 = 1.41e11j
+
+
+def _H_bajas(omega):
+    """H en la región de bajas frecuencias (escalar o arreglo)."""
+    return (_BAJAS_A * omega + _BAJAS_B) / ((omega - _BAJAS_R1) * (omega - _BAJAS_R2))
+
+
+def _H_medias(omega):
+    """H en la región de frecuencias medias (escalar o arreglo)."""
+    return _MEDIAS_A * omega * omega / ((omega - _MEDIAS_R1) * (omega - _MEDIAS_R2))
+
+
+def _H_altas(omega):
+    """H en la región de altas frecuencias (escalar o arreglo)."""
+    num = omega * omega * (_ALTAS_A * omega + _ALTAS_B)
+    den = ((omega + _ALTAS_D2) * omega + _ALTAS_D1) * omega + _ALTAS_D0
+    return num / den
+
+
+@lru_cache(maxsize=512)
 def H_amp(omega):
     """
     Ganancia compleja del amplificador H(ω) por regiones.
     Devuelve Vsal_amp / V_F (ambos en RMS, fasores).
     """
-    j = 1j
-
     # --------------------
     # Caso 1: bajas frecuencias
     # --------------------
     if omega < 18:
-        num = -13.03 * (j * omega - 0.6143)
-        den = omega**2 - 23.55 * j * omega - 79.68
-        return num / den
+        return _H_bajas(omega)
 
     # --------------------
-    # Caso 2: frecuencias medias 
+    # Caso 2: frecuencias medias
     # --------------------
     elif omega < 2e9:
-        num = -43.03 * (omega**2)
-        den = omega**2 - 22.94 * j * omega - 73.48   # ← AQUÍ SE AGREGA j
-        return num / den
+        return _H_medias(omega)
 
     # --------------------
     # Caso 3: altas frecuencias
     # --------------------
     else:
-        num = omega**2 * (0.4 * omega + 8.61e10 * j)
-        den = omega**3 - 2e9 * omega**2 * j - 4.69e10 * omega + 1.41e11 * j
-        return num / den
+        return _H_altas(omega)
+
+
+def H_amp_vec(omega):
+    """
+    Versión vectorizada de H_amp para un arreglo de frecuencias omega.
+    Evalúa las tres regiones sobre todo el arreglo y elige con np.select.
+    """
+    if np.isscalar(omega):
+        return H_amp(omega)
+    return _H_amp_arreglo(tuple(omega.tolist()))
+
+
+@lru_cache(maxsize=256)
+def _H_amp_arreglo(omegas):
+    """
+    Evalúa H para una tupla de frecuencias. Se memoiza porque la misma
+    señal suele simularse varias veces cambiando solo la carga.
+    """
+    omega = np.array(omegas)
+    H = np.select(
+        [omega < 18, omega < 2e9],
+        [_H_bajas(omega), _H_medias(omega)],
+        _H_altas(omega)
+    )
+    H.setflags(write=False)  # compartido entre llamadas
+    return H
+
 
 def salida_armonica(omega, A_rms, fase_rad, R, C, modo_carga):
     """
-    Calcula el fasor de salida (en la resistencia) para una componente
-    de frecuencia omega, dados R, C y el modo de carga.
+    Calcula los fasores de salida (en la resistencia) para todas las
+    componentes de frecuencia omega a la vez (arreglos de NumPy),
+    dados R, C y el modo de carga.
     """
-    j = 1j
+    # Decisiones de la carga: una sola vez por simulación, de modo que el
+    # cálculo sobre las componentes queda sin ramas
+    usar_C = modo_carga == 1 and C > 0   # RC en serie con capacitor
+    corto = modo_carga == 3
+    abierto = modo_carga == 4
 
-    # Fasor de entrada al amplificador (RMS)
-    V_F = A_rms * cmath.exp(j * fase_rad)
+    # Fasores de entrada al amplificador (RMS)
+    V_F = A_rms * np.exp(1j * fase_rad)
 
     # Salida del amplificador (antes de la carga externa)
-    H = H_amp(omega)
+    H = H_amp_vec(omega)
     V_sal_amp = H * V_F
 
-    # Casos especiales de carga
-    if modo_carga == 3:  # corto
-        V_out = 0j
-        I = 0j
-        return V_out, I
+    # Impedancia total Z_R + Z_C, con Z_C = 0 si no hay capacitor.
+    # Solo R con R = 0: se usa 1e30 para evitar división por cero
+    termino_C = (-1j / C) / omega if usar_C else 0j   # 1/(jωC) = (-j/C)/ω
+    R_ef = R if (R > 0 or usar_C) else 1e30
+    Z_tot = R_ef + termino_C
 
-    if modo_carga == 4:  # abierto
-        # No hay carga, asumimos Vout = salida del amplificador
-        V_out = V_sal_amp
-        I = 0j
-        return V_out, I
-
-    # Modos normales: 1 = RC, 2 = solo R
-    Z_R = complex(R, 0.0)
-
-    if modo_carga == 2 or C <= 0:
-        # Solo R
-        Z_tot = Z_R if R > 0 else 1e30  # evitar división por cero
-        I = V_sal_amp / Z_tot
-        V_out = I * Z_R
-        return V_out, I
-
-    # Modo 1: RC en serie
-    Z_C = 1.0 / (j * omega * C) if C > 0 else 1e30
-    Z_tot = Z_R + Z_C
-    if Z_tot == 0:
-        I = 0j
-        V_out = 0j
-    else:
-        I = V_sal_amp / Z_tot
-        V_out = I * Z_R  # medimos en la resistencia
+    I = V_sal_amp / Z_tot
+    V_out = I * R  # medimos en la resistencia
+
+    # Corto: todo en cero. Abierto: no hay carga, asumimos
+    # Vout = salida del amplificador e I = 0
+    V_out = np.where(corto, 0j, np.where(abierto, V_sal_amp, V_out))
+    I = np.where(corto or abierto, 0j, I)
 
     return V_out, I
 
@@ -259,42 +329,21 @@ def calcular_respuesta(R, C, modo_carga, f1, A1_rms, phi1_rad, armonicas):
     También devuelve lista con info de cada componente de salida
     para reconstruir la señal en el tiempo.
     """
-    componentes_salida = []  # {'f', 'Vout_rms', 'fase_rad'}
-    magnitudes_v = []
-    corrientes = []
-
-    # Fundamental
-    omega1 = 2 * math.pi * f1
-    Vout1, I1 = salida_armonica(omega1, A1_rms, phi1_rad, R, C, modo_carga)
-    Vout1_rms = abs(Vout1)
-    fase1 = cmath.phase(Vout1)
-
-    componentes_salida.append({
-        "f": f1,
-        "Vout_rms": Vout1_rms,
-        "fase_rad": fase1
-    })
-    magnitudes_v.append(Vout1_rms)
-    corrientes.append(I1)
-
-    # Armónicas
-    for armonica in armonicas:
-        fk = armonica["f"]
-        Ak_rms = armonica["A_rms"]
-        phik = armonica["fase_rad"]
-
-        omegak = 2 * math.pi * fk
-        Voutk, Ik = salida_armonica(omegak, Ak_rms, phik, R, C, modo_carga)
-        Voutk_rms = abs(Voutk)
-        fasek = cmath.phase(Voutk)
-
-        componentes_salida.append({
-            "f": fk,
-            "Vout_rms": Voutk_rms,
-            "fase_rad": fasek
-        })
-        magnitudes_v.append(Voutk_rms)
-        corrientes.append(Ik)
+    # Fundamental seguida de las armónicas
+    frecuencias = np.array([f1] + [a["f"] for a in armonicas])
+    amplitudes = np.array([A1_rms] + [a["A_rms"] for a in armonicas])
+    fases = np.array([phi1_rad] + [a["fase_rad"] for a in armonicas])
+
+    omega = _TWO_PI * frecuencias
+    Vout, I = salida_armonica(omega, amplitudes, fases, R, C, modo_carga)
+
+    magnitudes_v = np.abs(Vout)
+    componentes_salida = [  # {'f', 'Vout_rms', 'fase_rad'}
+        {"f": f, "Vout_rms": v, "fase_rad": fase}
+        for f, v, fase in zip(
+            frecuencias.tolist(), magnitudes_v.tolist(), np.angle(Vout).tolist()
+        )
+    ]
 
     # Casos especiales de corto y abierto
     if modo_carga == 3:  # corto
@@ -305,38 +354,31 @@ def calcular_respuesta(R, C, modo_carga, f1, A1_rms, phi1_rad, armonicas):
         # en componentes_salida ya tenemos todas en cero por salida_armonica
         return VRMS_total, IRMS_total, potencia_real, THD, componentes_salida
 
+    # VRMS total (todas las componentes, RMS cuadrático)
+    # (sumas de cuadrados como productos punto)
+    VRMS_total = math.sqrt(magnitudes_v @ magnitudes_v)
+
+    # THD basado en magnitud de salida
+    if magnitudes_v[0] > 0:
+        armonicas_v = magnitudes_v[1:]
+        THD = math.sqrt(armonicas_v @ armonicas_v) / magnitudes_v[0]
+    else:
+        THD = 0.0
+
     if modo_carga == 4:  # abierto
         # Vout es la salida del amplificador, pero I = 0 y P = 0
-        VRMS_total = math.sqrt(sum(v**2 for v in magnitudes_v))
         IRMS_total = 0.0
         potencia_real = 0.0
-        if magnitudes_v[0] > 0:
-            THD = math.sqrt(sum(v**2 for v in magnitudes_v[1:])) / magnitudes_v[0]
-        else:
-            THD = 0.0
         return VRMS_total, IRMS_total, potencia_real, THD, componentes_salida
 
     # Modo normal / solo R
-    # VRMS total (todas las componentes, RMS cuadrático)
-    VRMS_total = math.sqrt(sum(v**2 for v in magnitudes_v))
-
     # Corriente RMS total
-    IRMS_total = math.sqrt(sum(abs(I)**2 for I in corrientes))
+    IRMS_total = math.sqrt(np.vdot(I, I).real)  # vdot conjuga I sin temporal
 
-    # Potencia real en la resistencia (suma Re{V * I*})
-    potencia_real = 0.0
-    for idx, comp in enumerate(componentes_salida):
-        V_rms = comp["Vout_rms"]
-        fase = comp["fase_rad"]
-        V_complex = V_rms * cmath.exp(1j * fase)
-        I_complex = corrientes[idx]
-        potencia_real += (V_complex * np.conjugate(I_complex)).real
-
-    # THD basado en magnitud de salida
-    if magnitudes_v[0] > 0:
-        THD = math.sqrt(sum(v**2 for v in magnitudes_v[1:])) / magnitudes_v[0]
-    else:
-        THD = 0.0
+    # Potencia real en la resistencia (suma Re{V * I*}), directamente de
+    # los fasores complejos sin reconstruirlos desde magnitud y fase:
+    # suma de V.real*I.real + V.imag*I.imag = Re{vdot(I, V)}
+    potencia_real = float(np.vdot(I, Vout).real)
 
     return VRMS_total, IRMS_total, potencia_real, THD, componentes_salida
 
@@ -354,15 +396,23 @@ def generar_senal_tiempo(DC, componentes_salida, num_periodos=5, puntos=5000):
     T_fund = 1.0 / f_fund if f_fund > 0 else 1.0
 
     t = np.linspace(0, num_periodos * T_fund, puntos)
-    vout = np.zeros_like(t) + DC  # DC se suma directamente
-
-    for comp in componentes_salida:
-        f = comp["f"]
-        V_rms = comp["Vout_rms"]
-        fase = comp["fase_rad"]
-        V_pico = V_rms * math.sqrt(2.0)
-        omega = 2 * math.pi * f
-        vout += V_pico * np.sin(omega * t + fase)
+
+    # Salida en corto: todas las componentes son cero, solo queda el DC
+    if not any(c["Vout_rms"] for c in componentes_salida):
+        return t, np.full_like(t, DC)
+
+    omegas = _TWO_PI * np.array([c["f"] for c in componentes_salida])
+    V_picos = _SQRT2 * np.array([c["Vout_rms"] for c in componentes_salida])
+    fases = np.array([c["fase_rad"] for c in componentes_salida])
+
+    # Matriz de fases (componente x muestra): un solo sin y un producto
+    # matriz-vector en lugar de un temporal por armónica
+    matriz = np.multiply.outer(omegas, t)
+    matriz += fases[:, None]
+    np.sin(matriz, out=matriz)
+
+    vout = V_picos @ matriz
+    vout += DC  # DC se suma directamente
 
     return t, vout
 
@@ -9,29 +9,31 @@ GUI moderna con tema oscuro usando PySide6.
 
 import sys
 import math
-import cmath
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from enum import IntEnum
 
 import numpy as np
 
-# Matplotlib backend must be set before importing pyplot
-import matplotlib
-matplotlib.use('QtAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QGroupBox, QLabel, QDoubleSpinBox, QSpinBox,
     QComboBox, QPushButton, QSplitter, QScrollArea, QFrame,
     QStatusBar, QMenuBar, QMenu, QMessageBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QLocale, QObject, QSignalBlocker, QThread, QTimer, Qt, Signal, Slot
+)
 from PySide6.QtGui import QAction, QPalette, QColor, QFont, QIcon
 
+# PyQtGraph es opcional: si esta instalado se usa para la grafica, que se
+# redibuja mucho mas rapido que con Matplotlib
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
 
 # =============================================================================
 # CONSTANTES DE COLORES (TEMA OSCURO)
@@ -82,13 +84,83 @@ class ConfigCarga:
 
 @dataclass
 class ConfigSenal:
-    """Configuracion de la senal de entrada."""
+    """
+    Configuracion de la senal de entrada. No debe modificarse despues de
+    construirla: los arreglos calculados no se actualizan. Para otra senal
+    se construye un ConfigSenal nuevo.
+    """
     dc: float                          # Volts DC
     freq_fundamental: float            # Hz
     amp_fundamental_rms: float         # Volts RMS
     fase_fundamental_rad: float        # Radianes
     armonicas: List[Armonica] = field(default_factory=list)
 
+    # Arreglos (fundamental + armonicas) calculados al primer uso
+    _frecuencias: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    _amplitudes_rms: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+    _fases_rad: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    @property
+    def frecuencias(self) -> np.ndarray:
+        """Frecuencias en Hz, fundamental primero."""
+        if self._frecuencias is None:
+            self._frecuencias = np.array(
+                [self.freq_fundamental] + [a.frecuencia for a in self.armonicas]
+            )
+        return self._frecuencias
+
+    @property
+    def amplitudes_rms(self) -> np.ndarray:
+        """Amplitudes RMS en Volts, fundamental primero."""
+        if self._amplitudes_rms is None:
+            self._amplitudes_rms = np.array(
+                [self.amp_fundamental_rms] + [a.amplitud_rms for a in self.armonicas]
+            )
+        return self._amplitudes_rms
+
+    @property
+    def fases_rad(self) -> np.ndarray:
+        """Fases en radianes, fundamental primero."""
+        if self._fases_rad is None:
+            self._fases_rad = np.array(
+                [self.fase_fundamental_rad] + [a.fase_rad for a in self.armonicas]
+            )
+        return self._fases_rad
+
+    @classmethod
+    def desde_arreglos(
+        cls,
+        dc: float,
+        frecuencias: np.ndarray,
+        amplitudes_rms: np.ndarray,
+        fases_rad: np.ndarray
+    ) -> "ConfigSenal":
+        """
+        Construye la senal a partir de arreglos paralelos (fundamental
+        primero). Los arreglos se usan directamente como los calculados.
+        """
+        senal = cls(
+            dc=dc,
+            freq_fundamental=float(frecuencias[0]),
+            amp_fundamental_rms=float(amplitudes_rms[0]),
+            fase_fundamental_rad=float(fases_rad[0]),
+            armonicas=[
+                Armonica(frecuencia=f, amplitud_rms=a, fase_rad=p)
+                for f, a, p in zip(
+                    frecuencias[1:].tolist(),
+                    amplitudes_rms[1:].tolist(),
+                    fases_rad[1:].tolist()
+                )
+            ]
+        )
+        senal._frecuencias = frecuencias
+        senal._amplitudes_rms = amplitudes_rms
+        senal._fases_rad = fases_rad
+        return senal
+
 
 @dataclass
 class ComponenteSalida:
@@ -105,88 +177,167 @@ class Resultados:
     irms_total: float
     potencia_real: float
     thd: float
-    componentes: List[ComponenteSalida] = field(default_factory=list)
+    # Componentes de salida como arreglos paralelos (fundamental primero)
+    frecuencias: np.ndarray        # Hz
+    voltajes_rms: np.ndarray       # Volts RMS
+    fases_rad: np.ndarray          # Radianes
+
+    @property
+    def componentes(self) -> List[ComponenteSalida]:
+        """Componentes de salida como objetos; se construyen solo al pedirlas."""
+        return [
+            ComponenteSalida(frecuencia=f, voltaje_rms=v, fase_rad=p)
+            for f, v, p in zip(
+                self.frecuencias.tolist(),
+                self.voltajes_rms.tolist(),
+                self.fases_rad.tolist()
+            )
+        ]
 
 
 # =============================================================================
 # FUNCIONES DE CALCULO (Extraidas de amplificador.py)
 # =============================================================================
 
+_TWO_PI = 2.0 * math.pi
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT2 = 1.0 / _SQRT2   # pico a RMS
+
+# La senal en el tiempo solo se grafica: float32 basta y reduce a la mitad
+# el trafico de memoria. RMS, potencia y THD se calculan en float64.
+_DTYPE_SENAL = np.float32
+
+
+def _raices_cuadratica(b: complex, c: complex) -> Tuple[complex, complex]:
+    """Raices de w^2 + b w + c (para factorizar los denominadores)."""
+    disc = (b * b - 4 * c) ** 0.5
+    return (-b + disc) / 2, (-b - disc) / 2
+
+
+# Coeficientes de H(omega) por region, precalculados: nunca cambian.
+# Bajas:  H = (A w + B) / ((w - r1)(w - r2))
+_BAJAS_A = -13.03j
+_BAJAS_B = -13.03 * -0.6143
+_BAJAS_R1, _BAJAS_R2 = _raices_cuadratica(-23.55j, -79.68)
+
+# Medias: H = A w^2 / ((w - r1)(w - r2))
+_MEDIAS_A = -43.03
+_MEDIAS_R1, _MEDIAS_R2 = _raices_cuadratica(-22.94j, -73.48)
+
+# Altas:  H = w^2 (0.4 w + 8.61e10 j) / (w^3 - 2e9 j w^2 - 4.69e10 w + 1.41e11 j),
+#         denominador en forma de Horner
+_ALTAS_A = 0.4
+_ALTAS_B = 8.61e10j
+_ALTAS_D2 = -2e9j
+_ALTAS_D1 = -4.69e10
+_ALTAS_D0 = 1.41e11j
+
+
+def _H_bajas(omega):
+    """H en la region de bajas frecuencias (escalar o arreglo)."""
+    return (_BAJAS_A * omega + _BAJAS_B) / ((omega - _BAJAS_R1) * (omega - _BAJAS_R2))
+
+
+def _H_medias(omega):
+    """H en la region de frecuencias medias (escalar o arreglo)."""
+    return _MEDIAS_A * omega * omega / ((omega - _MEDIAS_R1) * (omega - _MEDIAS_R2))
+
+
+def _H_altas(omega):
+    """H en la region de altas frecuencias (escalar o arreglo)."""
+    num = omega * omega * (_ALTAS_A * omega + _ALTAS_B)
+    den = ((omega + _ALTAS_D2) * omega + _ALTAS_D1) * omega + _ALTAS_D0
+    return num / den
+
+
+@lru_cache(maxsize=512)
 def H_amp(omega: float) -> complex:
     """
     Ganancia compleja del amplificador H(omega) por regiones.
     Devuelve Vsal_amp / V_F (ambos en RMS, fasores).
     """
-    j = 1j
-
     # Caso 1: bajas frecuencias
     if omega < 18:
-        num = -13.03 * (j * omega - 0.6143)
-        den = omega**2 - 23.55 * j * omega - 79.68
-        return num / den
+        return _H_bajas(omega)
 
     # Caso 2: frecuencias medias
     elif omega < 2e9:
-        num = -43.03 * (omega**2)
-        den = omega**2 - 22.94 * j * omega - 73.48
-        return num / den
+        return _H_medias(omega)
 
     # Caso 3: altas frecuencias
     else:
-        num = omega**2 * (0.4 * omega + 8.61e10 * j)
-        den = omega**3 - 2e9 * omega**2 * j - 4.69e10 * omega + 1.41e11 * j
-        return num / den
+        return _H_altas(omega)
+
+
+def H_amp_vec(omega: np.ndarray) -> np.ndarray:
+    """
+    Version vectorizada de H_amp para un arreglo de frecuencias omega.
+    Evalua las tres regiones sobre todo el arreglo y elige con np.select.
+    """
+    if np.isscalar(omega):
+        return H_amp(omega)
+    return _H_amp_arreglo(tuple(omega.tolist()))
+
+
+@lru_cache(maxsize=256)
+def _H_amp_arreglo(omegas: Tuple[float, ...]) -> np.ndarray:
+    """
+    Evalua H para una tupla de frecuencias. Se memoiza porque la misma
+    senal suele simularse varias veces cambiando solo la carga.
+    """
+    omega = np.array(omegas)
+    H = np.select(
+        [omega < 18, omega < 2e9],
+        [_H_bajas(omega), _H_medias(omega)],
+        _H_altas(omega)
+    )
+    H.setflags(write=False)  # compartido entre llamadas
+    return H
 
 
 def salida_armonica(
-    omega: float,
-    amplitud_rms: float,
-    fase_rad: float,
+    omega: np.ndarray,
+    amplitud_rms: np.ndarray,
+    fase_rad: np.ndarray,
     carga: ConfigCarga
-) -> Tuple[complex, complex]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calcula el fasor de salida (en la resistencia) para una componente
-    de frecuencia omega, dados R, C y el modo de carga.
+    Calcula los fasores de salida (en la resistencia) para todas las
+    componentes de frecuencia omega a la vez, dados R, C y el modo de carga.
 
     Returns:
-        Tuple[V_out, I]: Fasor de voltaje y corriente de salida
+        Tuple[V_out, I]: Arreglos de fasores de voltaje y corriente de salida
     """
-    j = 1j
     R = carga.resistencia
     C = carga.capacitancia
     modo = carga.modo
 
-    # Fasor de entrada al amplificador (RMS)
-    V_F = amplitud_rms * cmath.exp(j * fase_rad)
+    # Decisiones de la carga: una sola vez por simulacion, de modo que el
+    # calculo sobre las componentes queda sin ramas
+    usar_C = modo == ModoCarga.RC_SERIE and C > 0
+    corto = modo == ModoCarga.CORTO
+    abierto = modo == ModoCarga.ABIERTO
+
+    # Fasores de entrada al amplificador (RMS)
+    V_F = amplitud_rms * np.exp(1j * fase_rad)
 
     # Salida del amplificador (antes de la carga externa)
-    H = H_amp(omega)
+    H = H_amp_vec(omega)
     V_sal_amp = H * V_F
 
-    # Casos especiales de carga
-    if modo == ModoCarga.CORTO:
-        return 0j, 0j
-
-    if modo == ModoCarga.ABIERTO:
-        return V_sal_amp, 0j
+    # Impedancia total Z_R + Z_C, con Z_C = 0 si no hay capacitor.
+    # Solo R con R = 0: se usa 1e30 para evitar division por cero
+    termino_C = (-1j / C) / omega if usar_C else 0j   # 1/(jwC) = (-j/C)/w
+    R_ef = R if (R > 0 or usar_C) else 1e30
+    Z_tot = R_ef + termino_C
 
-    # Modos normales: RC o solo R
-    Z_R = complex(R, 0.0)
-
-    if modo == ModoCarga.SOLO_R or C <= 0:
-        Z_tot = Z_R if R > 0 else 1e30
-        I = V_sal_amp / Z_tot
-        V_out = I * Z_R
-        return V_out, I
+    I = V_sal_amp / Z_tot
+    V_out = I * R  # medimos en la resistencia
 
-    # Modo RC en serie
-    Z_C = 1.0 / (j * omega * C) if C > 0 else 1e30
-    Z_tot = Z_R + Z_C
-    if Z_tot == 0:
-        return 0j, 0j
+    # Corto: todo en cero. Abierto: V_out es la salida del amplificador, I = 0
+    V_out = np.where(corto, 0j, np.where(abierto, V_sal_amp, V_out))
+    I = np.where(corto or abierto, 0j, I)
 
-    I = V_sal_amp / Z_tot
-    V_out = I * Z_R
     return V_out, I
 
 
@@ -194,45 +345,50 @@ def calcular_respuesta(carga: ConfigCarga, senal: ConfigSenal) -> Resultados:
     """
     Calcula VRMS_total, IRMS_total, potencia real y THD
     a partir de la carga, el amplificador y la senal de entrada.
+
+    Los resultados se memoizan por valor de (carga, senal), asi que el
+    objeto retornado puede ser compartido y no debe modificarse.
+    """
+    return _calcular_respuesta_cached(_clave_respuesta(carga, senal))
+
+
+def _clave_respuesta(carga: ConfigCarga, senal: ConfigSenal) -> tuple:
+    """
+    Clave hashable con los valores que determinan la respuesta. El DC no
+    afecta la respuesta en frecuencia, asi que no forma parte de la clave.
     """
-    componentes_salida: List[ComponenteSalida] = []
-    magnitudes_v: List[float] = []
-    corrientes: List[complex] = []
-
-    # Fundamental
-    omega1 = 2 * math.pi * senal.freq_fundamental
-    Vout1, I1 = salida_armonica(
-        omega1, senal.amp_fundamental_rms,
-        senal.fase_fundamental_rad, carga
+    return (
+        carga.resistencia, carga.capacitancia, int(carga.modo),
+        tuple(senal.frecuencias.tolist()),
+        tuple(senal.amplitudes_rms.tolist()),
+        tuple(senal.fases_rad.tolist())
     )
-    Vout1_rms = abs(Vout1)
-    fase1 = cmath.phase(Vout1)
-
-    componentes_salida.append(ComponenteSalida(
-        frecuencia=senal.freq_fundamental,
-        voltaje_rms=Vout1_rms,
-        fase_rad=fase1
-    ))
-    magnitudes_v.append(Vout1_rms)
-    corrientes.append(I1)
-
-    # Armonicas
-    for armonica in senal.armonicas:
-        omegak = 2 * math.pi * armonica.frecuencia
-        Voutk, Ik = salida_armonica(
-            omegak, armonica.amplitud_rms,
-            armonica.fase_rad, carga
-        )
-        Voutk_rms = abs(Voutk)
-        fasek = cmath.phase(Voutk)
 
-        componentes_salida.append(ComponenteSalida(
-            frecuencia=armonica.frecuencia,
-            voltaje_rms=Voutk_rms,
-            fase_rad=fasek
-        ))
-        magnitudes_v.append(Voutk_rms)
-        corrientes.append(Ik)
+
+@lru_cache(maxsize=32)
+def _calcular_respuesta_cached(clave: tuple) -> Resultados:
+    """Reconstruye la carga y los arreglos de la senal desde la clave."""
+    R, C, modo, frecuencias, amplitudes, fases = clave
+    carga = ConfigCarga(resistencia=R, capacitancia=C, modo=ModoCarga(modo))
+    return _calcular_respuesta(
+        carga, np.array(frecuencias), np.array(amplitudes), np.array(fases)
+    )
+
+
+def _calcular_respuesta(
+    carga: ConfigCarga,
+    frecuencias: np.ndarray,
+    amplitudes: np.ndarray,
+    fases: np.ndarray
+) -> Resultados:
+    """Implementacion de calcular_respuesta, sin memoizar."""
+    omega = _TWO_PI * frecuencias
+    V_out, I = salida_armonica(omega, amplitudes, fases, carga)
+
+    magnitudes_v = np.abs(V_out)
+    fases_salida = np.angle(V_out)
+    for arreglo in (frecuencias, magnitudes_v, fases_salida):
+        arreglo.setflags(write=False)  # compartidos a traves del cache
 
     # Casos especiales
     if carga.modo == ModoCarga.CORTO:
@@ -241,71 +397,188 @@ def calcular_respuesta(carga: ConfigCarga, senal: ConfigSenal) -> Resultados:
             irms_total=0.0,
             potencia_real=0.0,
             thd=0.0,
-            componentes=componentes_salida
+            frecuencias=frecuencias,
+            voltajes_rms=magnitudes_v,
+            fases_rad=fases_salida
         )
 
+    # Sumas de cuadrados como productos punto (BLAS nivel 1)
+    armonicas_v = magnitudes_v[1:]
+    vrms_total = math.sqrt(magnitudes_v @ magnitudes_v)
+    thd = (math.sqrt(armonicas_v @ armonicas_v) / magnitudes_v[0]
+           if magnitudes_v[0] > 0 else 0.0)
+
     if carga.modo == ModoCarga.ABIERTO:
-        vrms = math.sqrt(sum(v**2 for v in magnitudes_v))
-        thd = (math.sqrt(sum(v**2 for v in magnitudes_v[1:])) / magnitudes_v[0]
-               if magnitudes_v[0] > 0 else 0.0)
         return Resultados(
-            vrms_total=vrms,
+            vrms_total=vrms_total,
             irms_total=0.0,
             potencia_real=0.0,
             thd=thd,
-            componentes=componentes_salida
+            frecuencias=frecuencias,
+            voltajes_rms=magnitudes_v,
+            fases_rad=fases_salida
         )
 
     # Modo normal
-    vrms_total = math.sqrt(sum(v**2 for v in magnitudes_v))
-    irms_total = math.sqrt(sum(abs(I)**2 for I in corrientes))
-
-    # Potencia real en la resistencia
-    potencia_real = 0.0
-    for idx, comp in enumerate(componentes_salida):
-        V_complex = comp.voltaje_rms * cmath.exp(1j * comp.fase_rad)
-        I_complex = corrientes[idx]
-        potencia_real += (V_complex * np.conjugate(I_complex)).real
-
-    # THD
-    thd = (math.sqrt(sum(v**2 for v in magnitudes_v[1:])) / magnitudes_v[0]
-           if magnitudes_v[0] > 0 else 0.0)
+    irms_total = math.sqrt(np.vdot(I, I).real)  # vdot conjuga I sin temporal
+
+    # Potencia real en la resistencia, directamente de los fasores complejos:
+    # suma de Re{V I*} = V.real*I.real + V.imag*I.imag = Re{vdot(I, V)}
+    potencia_real = float(np.vdot(I, V_out).real)
 
     return Resultados(
         vrms_total=vrms_total,
         irms_total=irms_total,
         potencia_real=potencia_real,
         thd=thd,
-        componentes=componentes_salida
+        frecuencias=frecuencias,
+        voltajes_rms=magnitudes_v,
+        fases_rad=fases_salida
     )
 
 
+# Kernel de Numba para generar_senal_tiempo. Numba es opcional: se importa
+# y compila la primera vez que se necesita (False si no esta instalado).
+# Es secuencial: con a lo sumo 11 x 5000 terminos el paralelismo no aporta
+# nada, y un kernel paralelo llamado fuera del hilo principal con la capa
+# de hilos TBB impide que el proceso termine al salir.
+_sintetizador = None
+
+
+def _obtener_sintetizador():
+    """Retorna el kernel compilado con Numba, o None si Numba no esta disponible."""
+    global _sintetizador
+    if _sintetizador is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _sintetizador = False
+        else:
+            @njit(fastmath=True, cache=True)
+            def _sintetizar(t, omegas, V_picos, fases, dc, out):
+                for i in range(t.shape[0]):
+                    s = dc
+                    for k in range(omegas.shape[0]):
+                        s += V_picos[k] * math.sin(omegas[k] * t[i] + fases[k])
+                    out[i] = s
+
+            _sintetizador = _sintetizar
+    return _sintetizador or None
+
+
 def generar_senal_tiempo(
     dc: float,
-    componentes: List[ComponenteSalida],
+    frecuencias: np.ndarray,
+    voltajes_rms: np.ndarray,
+    fases_rad: np.ndarray,
     num_periodos: int = 5,
     puntos: int = 5000
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Genera la senal de salida vout(t) a partir de sus componentes
-    en frecuencia (fundamental + armonicas).
+    en frecuencia (fundamental + armonicas), dadas como arreglos paralelos
+    (por ejemplo los de Resultados).
+    Los arreglos retornados son float32, pensados solo para graficar.
+
+    Los arreglos se memoizan y son de solo lectura.
     """
-    if not componentes:
-        t = np.linspace(0, 1, puntos)
+    return _generar_senal_tiempo_cached(
+        dc, tuple(frecuencias.tolist()), tuple(voltajes_rms.tolist()),
+        tuple(fases_rad.tolist()), num_periodos, puntos
+    )
+
+
+@lru_cache(maxsize=32)
+def _generar_senal_tiempo_cached(
+    dc: float,
+    frecuencias: Tuple[float, ...],
+    voltajes_rms: Tuple[float, ...],
+    fases_rad: Tuple[float, ...],
+    num_periodos: int,
+    puntos: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Version memoizada de _generar_senal_tiempo, con tuplas como clave."""
+    t, vout = _generar_senal_tiempo(
+        dc, np.array(frecuencias), np.array(voltajes_rms), np.array(fases_rad),
+        num_periodos, puntos
+    )
+
+    # Compartidos entre llamadas a traves del cache
+    t.setflags(write=False)
+    vout.setflags(write=False)
+    return t, vout
+
+
+def _generar_senal_tiempo(
+    dc: float,
+    frecuencias: np.ndarray,
+    voltajes_rms: np.ndarray,
+    fases_rad: np.ndarray,
+    num_periodos: int,
+    puntos: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Implementacion de generar_senal_tiempo. La base de tiempo es el arreglo
+    compartido (de solo lectura) de _base_tiempo.
+    """
+    # Sin componentes: un segundo de senal constante
+    f_fund, periodos = (frecuencias[0], num_periodos) if frecuencias.size else (1.0, 1)
+    t = _base_tiempo(float(f_fund), periodos, puntos)
+
+    if frecuencias.size == 0:
         return t, np.full_like(t, dc)
 
-    f_fund = componentes[0].frecuencia
-    T_fund = 1.0 / f_fund if f_fund > 0 else 1.0
+    # Salida en corto: todas las componentes son cero, solo queda el DC
+    if not voltajes_rms.any():
+        return t, np.full_like(t, dc)
 
-    t = np.linspace(0, num_periodos * T_fund, puntos)
-    vout = np.zeros_like(t) + dc
+    return t, _sintetizar_senal(t, dc, frecuencias, voltajes_rms, fases_rad)
 
-    for comp in componentes:
-        V_pico = comp.voltaje_rms * math.sqrt(2.0)
-        omega = 2 * math.pi * comp.frecuencia
-        vout += V_pico * np.sin(omega * t + comp.fase_rad)
 
-    return t, vout
+def _periodo(f_fund: float) -> float:
+    """Periodo de la fundamental; 1 s si la frecuencia no es positiva."""
+    return 1.0 / f_fund if f_fund > 0 else 1.0
+
+
+@lru_cache(maxsize=8)
+def _base_tiempo(f_fund: float, num_periodos: int, puntos: int) -> np.ndarray:
+    """
+    Base de tiempo de num_periodos periodos de la fundamental. Se memoiza
+    porque simulaciones con la misma fundamental comparten el mismo eje.
+    """
+    t = np.linspace(0, num_periodos * _periodo(f_fund), puntos, dtype=_DTYPE_SENAL)
+    t.setflags(write=False)  # compartido entre llamadas
+    return t
+
+
+def _sintetizar_senal(
+    t: np.ndarray,
+    dc: float,
+    frecuencias: np.ndarray,
+    voltajes_rms: np.ndarray,
+    fases: np.ndarray
+) -> np.ndarray:
+    """Suma DC + todas las componentes sinusoidales sobre la base de tiempo t."""
+    dtype = t.dtype
+    omegas = (_TWO_PI * frecuencias).astype(dtype)
+    V_picos = (_SQRT2 * voltajes_rms).astype(dtype)
+    fases = fases.astype(dtype)
+
+    sintetizar = _obtener_sintetizador()
+    if sintetizar is not None:
+        vout = np.empty_like(t)
+        sintetizar(t, omegas, V_picos, fases, dtype.type(dc), vout)
+        return vout
+
+    # Sin Numba: matriz de fases (componente x muestra), un solo sin y un
+    # producto matriz-vector en lugar de un temporal por armonica
+    matriz = np.multiply.outer(omegas, t)
+    matriz += fases[:, None]
+    np.sin(matriz, out=matriz)
+
+    vout = V_picos @ matriz
+    vout += dc
+    return vout
 
 
 # =============================================================================
@@ -620,16 +893,77 @@ def apply_dark_theme(app: QApplication):
 # WIDGET: PLOT CANVAS (MATPLOTLIB)
 # =============================================================================
 
-class PlotCanvas(FigureCanvasQTAgg):
+def _envolvente_min_max(
+    t: np.ndarray,
+    vout: np.ndarray,
+    segmentos: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce la senal a `segmentos` tramos consecutivos, conservando el minimo
+    y el maximo de cada uno (2 puntos por tramo), de modo que los picos se
+    siguen viendo. Las muestras que no dividen en partes iguales se reparten
+    entre los tramos (cada uno tiene len(vout) // segmentos muestras o una
+    mas), sin dejar un resto sin reducir.
+    """
+    inicios = np.arange(segmentos) * len(vout) // segmentos
+
+    # reduceat reduce cada tramo hasta el inicio del siguiente; el ultimo
+    # llega hasta el final del arreglo
+    v_ds = np.empty((segmentos, 2), dtype=vout.dtype)
+    v_ds[:, 0] = np.minimum.reduceat(vout, inicios)
+    v_ds[:, 1] = np.maximum.reduceat(vout, inicios)
+
+    # Cada par se ubica al inicio y al final de su tramo
+    t_ds = np.empty((segmentos, 2), dtype=t.dtype)
+    t_ds[:, 0] = t[inicios]
+    t_ds[:-1, 1] = t[inicios[1:] - 1]
+    t_ds[-1, 1] = t[-1]
+
+    return t_ds.ravel(), v_ds.ravel()
+
+
+class PlotCanvas(QWidget):
     """Canvas de Matplotlib con tema oscuro."""
 
     def __init__(self, parent=None):
+        super().__init__(parent)
+        # Matplotlib se importa al crear la grafica y no al cargar el modulo:
+        # es pesado y no hace falta si se usa PyQtGraph
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
         self.fig = Figure(figsize=(8, 5), dpi=100)
         self.fig.patch.set_facecolor(COLORS['background'])
         self.ax = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.setParent(parent)
+        self.canvas = FigureCanvasQTAgg(self.fig)
+        layout.addWidget(self.canvas)
+
+        # Tema, etiquetas y layout se configuran una sola vez; cada
+        # simulacion solo cambia los datos de la linea persistente
         self._setup_axes()
+        self._line, = self.ax.plot(
+            [], [], color=COLORS['accent'], linewidth=1.5, animated=True
+        )
+        self.ax.set_xlabel("Tiempo [ms]", fontsize=11)
+        self.ax.set_ylabel("v_out(t) [V]", fontsize=11)
+        self.ax.set_title("Señal de salida en el tiempo", fontsize=12, fontweight='bold')
+        self.fig.tight_layout()
+
+        # Blitting: fondo de los ejes (sin la linea) del ultimo dibujo
+        # completo, que se recaptura en cada uno (incluido al redimensionar)
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Redibujos agrupados: a lo sumo uno cada ~33 ms (30 por segundo),
+        # siempre con los datos mas recientes
+        self._pendiente: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._refresh = QTimer(self)
+        self._refresh.setSingleShot(True)
+        self._refresh.setInterval(33)
+        self._refresh.timeout.connect(self._do_draw)
 
     def _setup_axes(self):
         """Configura los ejes con el tema oscuro."""
@@ -645,27 +979,141 @@ class PlotCanvas(FigureCanvasQTAgg):
         self.ax.grid(True, color=COLORS['border'], linestyle='--', alpha=0.5)
 
     def plot_signal(self, t: np.ndarray, vout: np.ndarray):
-        """Grafica la senal de salida."""
-        self.ax.clear()
-        self._setup_axes()
+        """Grafica la senal de salida en el proximo redibujo programado."""
+        self._pendiente = (t, vout)
+        if not self._refresh.isActive():
+            self._refresh.start()
+
+    @Slot()
+    def _do_draw(self):
+        """Dibuja los ultimos datos recibidos por plot_signal."""
+        if self._pendiente is None:
+            return
+        t, vout = self._pendiente
+        self._pendiente = None
+
+        # Con varias muestras por columna de pixeles, graficar solo la
+        # envolvente min/max de cada columna (2 puntos en lugar de 3 o mas)
+        segmentos = max(self.canvas.width(), 1)
+        if len(vout) // segmentos >= 3:
+            t, vout = _envolvente_min_max(t, vout, segmentos)
+
+        # Escalar a ms despues de reducir: menos puntos que multiplicar
+        self._line.set_data(t * 1000, vout)
+        limites = (self.ax.get_xlim(), self.ax.get_ylim())
+        self.ax.relim()
+        self.ax.autoscale()
+
+        # Si cambian los limites cambian las marcas de los ejes: dibujo completo
+        if self._bg is None or limites != (self.ax.get_xlim(), self.ax.get_ylim()):
+            self.canvas.draw_idle()
+            return
 
-        self.ax.plot(t * 1000, vout, color=COLORS['accent'], linewidth=1.5)
-        self.ax.set_xlabel("Tiempo [ms]", fontsize=11)
-        self.ax.set_ylabel("v_out(t) [V]", fontsize=11)
-        self.ax.set_title("Señal de salida en el tiempo", fontsize=12, fontweight='bold')
+        # Si no, solo se redibuja la linea sobre el fondo guardado
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._line)
+        self.canvas.blit(self.ax.bbox)
 
-        self.fig.tight_layout()
-        self.draw()
+    def _on_draw(self, event):
+        """Guarda el fondo tras un dibujo completo y dibuja la linea encima."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._line)
 
     def clear(self):
         """Limpia la grafica."""
-        self.ax.clear()
-        self._setup_axes()
-        self.ax.set_xlabel("Tiempo [ms]", fontsize=11)
-        self.ax.set_ylabel("v_out(t) [V]", fontsize=11)
-        self.ax.set_title("Señal de salida en el tiempo", fontsize=12, fontweight='bold')
-        self.fig.tight_layout()
-        self.draw()
+        self._refresh.stop()
+        self._pendiente = None
+        self._line.set_data([], [])
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self.canvas.draw_idle()
+
+
+# =============================================================================
+# WIDGET: PLOT CANVAS (PYQTGRAPH)
+# =============================================================================
+
+class PyQtGraphCanvas(QWidget):
+    """Grafica con PyQtGraph y tema oscuro; misma interfaz que PlotCanvas."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.plot_widget = pg.PlotWidget(background=COLORS['background'])
+        self.plot_widget.setTitle(
+            "Señal de salida en el tiempo", color=COLORS['foreground'], bold=True
+        )
+        self.plot_widget.setLabel('bottom', "Tiempo [ms]")
+        self.plot_widget.setLabel('left', "v_out(t) [V]")
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        for nombre in ('bottom', 'left'):
+            eje = self.plot_widget.getAxis(nombre)
+            eje.setPen(pg.mkPen(COLORS['border']))
+            eje.setTextPen(pg.mkPen(COLORS['foreground']))
+
+        # Solo dibujar lo visible y reducir puntos a la resolucion de pantalla
+        self.plot_widget.setClipToView(True)
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+
+        # Una sola curva persistente; cada simulacion solo cambia sus datos
+        self.curve = self.plot_widget.plot(pen=pg.mkPen(COLORS['accent'], width=2))
+        layout.addWidget(self.plot_widget)
+
+    def plot_signal(self, t: np.ndarray, vout: np.ndarray):
+        """Grafica la senal de salida."""
+        self.curve.setData(t * 1000, vout)
+        self.plot_widget.enableAutoRange()
+
+    def clear(self):
+        """Limpia la grafica."""
+        self.curve.setData([], [])
+
+
+def crear_plot_canvas(parent=None) -> QWidget:
+    """Retorna PyQtGraphCanvas si PyQtGraph esta instalado, si no PlotCanvas."""
+    if pg is not None:
+        return PyQtGraphCanvas(parent)
+    return PlotCanvas(parent)
+
+
+# =============================================================================
+# FABRICAS DE WIDGETS
+# =============================================================================
+
+def _make_spin(lo: float, hi: float, suffix: str, decimals: int,
+               value: float, tip: str = "") -> QDoubleSpinBox:
+    """Crea un QDoubleSpinBox con rango, sufijo, decimales y valor inicial."""
+    spin = QDoubleSpinBox()
+    spin.setRange(lo, hi)
+    spin.setSuffix(suffix)
+    spin.setDecimals(decimals)
+    spin.setValue(value)
+    # valueChanged solo al confirmar el valor, no en cada tecla
+    spin.setKeyboardTracking(False)
+    if tip:
+        spin.setToolTip(tip)
+    return spin
+
+
+def _make_amp_row(value: float, tip: str = "",
+                  tipo_tip: str = "") -> Tuple[QHBoxLayout, QDoubleSpinBox, QComboBox]:
+    """Crea la fila de amplitud: spinbox en Volts y selector Pico/RMS."""
+    row = QHBoxLayout()
+    row.setContentsMargins(0, 0, 0, 0)
+    row.setSpacing(6)
+
+    spin = _make_spin(0, 10000, " V", 4, value, tip)
+    row.addWidget(spin, 1)
+
+    combo = QComboBox()
+    combo.addItems(["Pico", "RMS"])
+    combo.setFixedWidth(70)
+    if tipo_tip:
+        combo.setToolTip(tipo_tip)
+    row.addWidget(combo, 0)
+    return row, spin, combo
 
 
 # =============================================================================
@@ -676,6 +1124,7 @@ class HarmonicCard(QFrame):
     """Tarjeta expandible para una armonica individual."""
 
     removed = Signal(object)  # Emite self cuando se elimina
+    changed = Signal()        # Emite cuando cambia algun valor
 
     def __init__(self, index: int, parent=None):
         super().__init__(parent)
@@ -683,6 +1132,11 @@ class HarmonicCard(QFrame):
         self.setObjectName("harmonicCard")
         self._setup_ui()
 
+        self.spin_freq.valueChanged.connect(self.changed)
+        self.spin_amp.valueChanged.connect(self.changed)
+        self.combo_tipo.currentIndexChanged.connect(self.changed)
+        self.spin_fase.valueChanged.connect(self.changed)
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 8, 10, 10)
@@ -690,9 +1144,9 @@ class HarmonicCard(QFrame):
 
         # Header con titulo y boton eliminar
         header = QHBoxLayout()
-        title = QLabel(f"Armonica {self.index + 1}")
-        title.setObjectName("cardTitle")
-        header.addWidget(title)
+        self._title_label = QLabel(f"Armonica {self.index + 1}")
+        self._title_label.setObjectName("cardTitle")
+        header.addWidget(self._title_label)
         header.addStretch()
 
         btn_remove = QPushButton("X")
@@ -708,64 +1162,38 @@ class HarmonicCard(QFrame):
         form.setSpacing(6)
 
         # Frecuencia
-        self.spin_freq = QDoubleSpinBox()
-        self.spin_freq.setRange(0.001, 1e9)
-        self.spin_freq.setSuffix(" Hz")
-        self.spin_freq.setDecimals(2)
-        self.spin_freq.setValue(1000)
+        self.spin_freq = _make_spin(0.001, 1e9, " Hz", 2, 1000)
         form.addRow("Frecuencia:", self.spin_freq)
 
         # Amplitud
-        amp_layout = QHBoxLayout()
-        amp_layout.setContentsMargins(0, 0, 0, 0)
-        amp_layout.setSpacing(6)
-        self.spin_amp = QDoubleSpinBox()
-        self.spin_amp.setRange(0, 10000)
-        self.spin_amp.setSuffix(" V")
-        self.spin_amp.setDecimals(4)
-        self.spin_amp.setValue(1.0)
-        amp_layout.addWidget(self.spin_amp, 1)
-
-        self.combo_tipo = QComboBox()
-        self.combo_tipo.addItems(["Pico", "RMS"])
-        self.combo_tipo.setFixedWidth(70)
-        amp_layout.addWidget(self.combo_tipo, 0)
+        amp_layout, self.spin_amp, self.combo_tipo = _make_amp_row(1.0)
         form.addRow("Amplitud:", amp_layout)
 
         # Fase
-        self.spin_fase = QDoubleSpinBox()
-        self.spin_fase.setRange(-360, 360)
-        self.spin_fase.setSuffix(" grados")
-        self.spin_fase.setDecimals(2)
-        self.spin_fase.setValue(0)
+        self.spin_fase = _make_spin(-360, 360, " grados", 2, 0)
         form.addRow("Fase:", self.spin_fase)
 
         layout.addLayout(form)
 
+    @Slot()
     def _on_remove(self):
         """Emite senal de eliminacion."""
         self.removed.emit(self)
 
-    def get_armonica(self) -> Armonica:
-        """Retorna la configuracion de la armonica."""
-        amplitud = self.spin_amp.value()
-        if self.combo_tipo.currentIndex() == 0:  # Pico
-            amplitud_rms = amplitud / math.sqrt(2)
-        else:
-            amplitud_rms = amplitud
-
-        return Armonica(
-            frecuencia=self.spin_freq.value(),
-            amplitud_rms=amplitud_rms,
-            fase_rad=math.radians(self.spin_fase.value())
-        )
-
     def update_index(self, new_index: int):
         """Actualiza el indice mostrado."""
         self.index = new_index
-        title = self.findChild(QLabel, "cardTitle")
-        if title:
-            title.setText(f"Armonica {new_index + 1}")
+        self._title_label.setText(f"Armonica {new_index + 1}")
+
+    def reset(self):
+        """Reinicia los valores a sus defaults, con una sola senal changed."""
+        with QSignalBlocker(self.spin_freq), QSignalBlocker(self.spin_amp), \
+                QSignalBlocker(self.combo_tipo), QSignalBlocker(self.spin_fase):
+            self.spin_freq.setValue(1000)
+            self.spin_amp.setValue(1.0)
+            self.combo_tipo.setCurrentIndex(0)
+            self.spin_fase.setValue(0)
+        self.changed.emit()
 
 
 # =============================================================================
@@ -777,28 +1205,29 @@ class LoadPanel(QGroupBox):
 
     def __init__(self, parent=None):
         super().__init__("Configuracion de Carga", parent)
+        # Configuracion construida en el ultimo get_config; se descarta
+        # cuando cambia algun widget
+        self._cached: Optional[ConfigCarga] = None
         self._setup_ui()
 
+        self.spin_r.valueChanged.connect(self._invalidate)
+        self.spin_c.valueChanged.connect(self._invalidate)
+        self.combo_modo.currentIndexChanged.connect(self._invalidate)
+
     def _setup_ui(self):
         layout = QFormLayout(self)
         layout.setSpacing(10)
 
         # Resistencia
-        self.spin_r = QDoubleSpinBox()
-        self.spin_r.setRange(0, 1e9)
-        self.spin_r.setSuffix(" Ohm")
-        self.spin_r.setDecimals(2)
-        self.spin_r.setValue(1000)
-        self.spin_r.setToolTip("Resistencia de carga en ohmios (>= 0)")
+        self.spin_r = _make_spin(
+            0, 1e9, " Ohm", 2, 1000, "Resistencia de carga en ohmios (>= 0)"
+        )
         layout.addRow("Resistencia (R):", self.spin_r)
 
         # Capacitancia
-        self.spin_c = QDoubleSpinBox()
-        self.spin_c.setRange(0, 1e6)
-        self.spin_c.setSuffix(" uF")
-        self.spin_c.setDecimals(3)
-        self.spin_c.setValue(10)
-        self.spin_c.setToolTip("Capacitancia en microfaradios (0 si no hay capacitor)")
+        self.spin_c = _make_spin(
+            0, 1e6, " uF", 3, 10, "Capacitancia en microfaradios (0 si no hay capacitor)"
+        )
         layout.addRow("Capacitancia (C):", self.spin_c)
 
         # Modo
@@ -812,19 +1241,32 @@ class LoadPanel(QGroupBox):
         self.combo_modo.setToolTip("Modo de conexion de la carga")
         layout.addRow("Modo de carga:", self.combo_modo)
 
+    @Slot()
+    def _invalidate(self):
+        """Descarta la configuracion cacheada."""
+        self._cached = None
+
     def get_config(self) -> ConfigCarga:
-        """Retorna la configuracion de carga actual."""
-        return ConfigCarga(
-            resistencia=self.spin_r.value(),
-            capacitancia=self.spin_c.value() * 1e-6,  # uF a F
-            modo=ModoCarga(self.combo_modo.currentIndex() + 1)
-        )
+        """
+        Retorna la configuracion de carga actual. Mientras no cambien los
+        widgets se retorna el mismo objeto, que no debe modificarse.
+        """
+        if self._cached is None:
+            self._cached = ConfigCarga(
+                resistencia=self.spin_r.value(),
+                capacitancia=self.spin_c.value() * 1e-6,  # uF a F
+                modo=ModoCarga(self.combo_modo.currentIndex() + 1)
+            )
+        return self._cached
 
     def reset(self):
-        """Reinicia los valores a sus defaults."""
-        self.spin_r.setValue(1000)
-        self.spin_c.setValue(10)
-        self.combo_modo.setCurrentIndex(0)
+        """Reinicia los valores a sus defaults, invalidando una sola vez."""
+        with QSignalBlocker(self.spin_r), QSignalBlocker(self.spin_c), \
+                QSignalBlocker(self.combo_modo):
+            self.spin_r.setValue(1000)
+            self.spin_c.setValue(10)
+            self.combo_modo.setCurrentIndex(0)
+        self._invalidate()
 
 
 # =============================================================================
@@ -837,8 +1279,17 @@ class SignalPanel(QGroupBox):
     def __init__(self, parent=None):
         super().__init__("Senal de Entrada", parent)
         self.harmonic_cards: List[HarmonicCard] = []
+        # Configuracion construida en el ultimo get_config; se descarta
+        # cuando cambia algun widget o se agrega/elimina una armonica
+        self._cached: Optional[ConfigSenal] = None
         self._setup_ui()
 
+        self.spin_dc.valueChanged.connect(self._invalidate)
+        self.spin_freq.valueChanged.connect(self._invalidate)
+        self.spin_amp.valueChanged.connect(self._invalidate)
+        self.combo_tipo.currentIndexChanged.connect(self._invalidate)
+        self.spin_fase.valueChanged.connect(self._invalidate)
+
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -848,49 +1299,25 @@ class SignalPanel(QGroupBox):
         form.setSpacing(8)
 
         # DC
-        self.spin_dc = QDoubleSpinBox()
-        self.spin_dc.setRange(-1000, 1000)
-        self.spin_dc.setSuffix(" V")
-        self.spin_dc.setDecimals(4)
-        self.spin_dc.setValue(0)
-        self.spin_dc.setToolTip("Componente de voltaje DC")
+        self.spin_dc = _make_spin(-1000, 1000, " V", 4, 0, "Componente de voltaje DC")
         form.addRow("Componente DC:", self.spin_dc)
 
         # Frecuencia fundamental
-        self.spin_freq = QDoubleSpinBox()
-        self.spin_freq.setRange(0.001, 1e9)
-        self.spin_freq.setSuffix(" Hz")
-        self.spin_freq.setDecimals(2)
-        self.spin_freq.setValue(60)
-        self.spin_freq.setToolTip("Frecuencia de la senal fundamental (> 0)")
+        self.spin_freq = _make_spin(
+            0.001, 1e9, " Hz", 2, 60, "Frecuencia de la senal fundamental (> 0)"
+        )
         form.addRow("Frecuencia (f1):", self.spin_freq)
 
         # Amplitud fundamental
-        amp_layout = QHBoxLayout()
-        amp_layout.setContentsMargins(0, 0, 0, 0)
-        amp_layout.setSpacing(6)
-        self.spin_amp = QDoubleSpinBox()
-        self.spin_amp.setRange(0, 10000)
-        self.spin_amp.setSuffix(" V")
-        self.spin_amp.setDecimals(4)
-        self.spin_amp.setValue(10)
-        self.spin_amp.setToolTip("Amplitud de la senal fundamental")
-        amp_layout.addWidget(self.spin_amp, 1)
-
-        self.combo_tipo = QComboBox()
-        self.combo_tipo.addItems(["Pico", "RMS"])
-        self.combo_tipo.setFixedWidth(70)
-        self.combo_tipo.setToolTip("Tipo de amplitud: Pico o RMS")
-        amp_layout.addWidget(self.combo_tipo, 0)
+        amp_layout, self.spin_amp, self.combo_tipo = _make_amp_row(
+            10, "Amplitud de la senal fundamental", "Tipo de amplitud: Pico o RMS"
+        )
         form.addRow("Amplitud (A1):", amp_layout)
 
         # Fase fundamental
-        self.spin_fase = QDoubleSpinBox()
-        self.spin_fase.setRange(-360, 360)
-        self.spin_fase.setSuffix(" grados")
-        self.spin_fase.setDecimals(2)
-        self.spin_fase.setValue(0)
-        self.spin_fase.setToolTip("Fase de la senal fundamental")
+        self.spin_fase = _make_spin(
+            -360, 360, " grados", 2, 0, "Fase de la senal fundamental"
+        )
         form.addRow("Fase (phi1):", self.spin_fase)
 
         layout.addLayout(form)
@@ -920,11 +1347,24 @@ class SignalPanel(QGroupBox):
         self.scroll_layout = QVBoxLayout(self.scroll_content)
         self.scroll_layout.setContentsMargins(0, 0, 0, 0)
         self.scroll_layout.setSpacing(8)
+
+        # Las 10 tarjetas se crean una sola vez, ocultas; agregar o eliminar
+        # una armonica solo las muestra u oculta. Las libres quedan siempre
+        # despues de las visibles en el layout, en el orden de esta lista.
+        self._free_cards: List[HarmonicCard] = []
+        for i in range(10):
+            card = HarmonicCard(i)
+            card.removed.connect(self._remove_harmonic)
+            card.changed.connect(self._invalidate)
+            card.hide()
+            self.scroll_layout.addWidget(card)
+            self._free_cards.append(card)
         self.scroll_layout.addStretch()
 
         self.scroll_area.setWidget(self.scroll_content)
         layout.addWidget(self.scroll_area, stretch=1)  # Expandir para usar espacio disponible
 
+    @Slot()
     def _add_harmonic(self):
         """Agrega una nueva tarjeta de armonica."""
         if len(self.harmonic_cards) >= 10:
@@ -934,27 +1374,42 @@ class SignalPanel(QGroupBox):
             )
             return
 
-        card = HarmonicCard(len(self.harmonic_cards))
-        card.removed.connect(self._remove_harmonic)
-        self.harmonic_cards.append(card)
+        # Un solo relayout y repintado al final de la operacion
+        self.scroll_content.setUpdatesEnabled(False)
 
-        # Insertar antes del stretch
-        self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, card)
+        # La primera tarjeta libre va justo despues de las visibles
+        card = self._free_cards.pop(0)
+        card.update_index(len(self.harmonic_cards))
+        card.show()
+        self.harmonic_cards.append(card)
+        self._invalidate()
 
         self._update_add_button()
+        self.scroll_content.setUpdatesEnabled(True)
 
+    @Slot(object)
     def _remove_harmonic(self, card: HarmonicCard):
         """Elimina una tarjeta de armonica."""
         if card in self.harmonic_cards:
+            # Un solo relayout y repintado al final de la operacion
+            self.scroll_content.setUpdatesEnabled(False)
+
             self.harmonic_cards.remove(card)
+            card.hide()
+            card.reset()
+
+            # Devolverla al final del layout (antes del stretch) y del pool
             self.scroll_layout.removeWidget(card)
-            card.deleteLater()
+            self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, card)
+            self._free_cards.append(card)
+            self._invalidate()
 
             # Actualizar indices
             for i, c in enumerate(self.harmonic_cards):
                 c.update_index(i)
 
             self._update_add_button()
+            self.scroll_content.setUpdatesEnabled(True)
 
     def _update_add_button(self):
         """Actualiza el estado del boton agregar."""
@@ -962,35 +1417,56 @@ class SignalPanel(QGroupBox):
         count = len(self.harmonic_cards)
         self.btn_add.setText(f" +  Agregar ({count}/10)")
 
-    def get_config(self) -> ConfigSenal:
-        """Retorna la configuracion de senal actual."""
-        amplitud = self.spin_amp.value()
-        if self.combo_tipo.currentIndex() == 0:  # Pico
-            amplitud_rms = amplitud / math.sqrt(2)
-        else:
-            amplitud_rms = amplitud
-
-        armonicas = [card.get_armonica() for card in self.harmonic_cards]
+    def get_config_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Retorna (frecuencias, amplitudes_rms, fases_rad) de la fundamental
+        y las armonicas como arreglos paralelos, fundamental primero.
+        """
+        # Primero todos los valores de los widgets, luego una sola
+        # conversion vectorizada
+        fuentes = [self] + self.harmonic_cards
+        frecuencias = np.array([w.spin_freq.value() for w in fuentes])
+        amplitudes = np.array([w.spin_amp.value() for w in fuentes])
+        es_pico = np.array([w.combo_tipo.currentIndex() == 0 for w in fuentes])
+        fases = np.array([w.spin_fase.value() for w in fuentes])
+
+        amplitudes_rms = np.where(es_pico, amplitudes * _INV_SQRT2, amplitudes)
+        return frecuencias, amplitudes_rms, np.deg2rad(fases)
+
+    @Slot()
+    def _invalidate(self):
+        """Descarta la configuracion cacheada."""
+        self._cached = None
 
-        return ConfigSenal(
-            dc=self.spin_dc.value(),
-            freq_fundamental=self.spin_freq.value(),
-            amp_fundamental_rms=amplitud_rms,
-            fase_fundamental_rad=math.radians(self.spin_fase.value()),
-            armonicas=armonicas
-        )
+    def get_config(self) -> ConfigSenal:
+        """
+        Retorna la configuracion de senal actual. Mientras no cambien los
+        widgets se retorna el mismo objeto, que no debe modificarse.
+        """
+        if self._cached is None:
+            self._cached = ConfigSenal.desde_arreglos(
+                self.spin_dc.value(), *self.get_config_arrays()
+            )
+        return self._cached
 
     def reset(self):
-        """Reinicia los valores a sus defaults."""
-        self.spin_dc.setValue(0)
-        self.spin_freq.setValue(60)
-        self.spin_amp.setValue(10)
-        self.combo_tipo.setCurrentIndex(0)
-        self.spin_fase.setValue(0)
-
-        # Eliminar todas las tarjetas de armonicas
+        """Reinicia los valores a sus defaults, invalidando una sola vez."""
+        with QSignalBlocker(self.spin_dc), QSignalBlocker(self.spin_freq), \
+                QSignalBlocker(self.spin_amp), QSignalBlocker(self.combo_tipo), \
+                QSignalBlocker(self.spin_fase):
+            self.spin_dc.setValue(0)
+            self.spin_freq.setValue(60)
+            self.spin_amp.setValue(10)
+            self.combo_tipo.setCurrentIndex(0)
+            self.spin_fase.setValue(0)
+        self._invalidate()
+
+        # Eliminar todas las tarjetas de armonicas; con las actualizaciones
+        # del panel suspendidas, se repinta una sola vez al terminar
+        self.setUpdatesEnabled(False)
         for card in self.harmonic_cards[:]:
             self._remove_harmonic(card)
+        self.setUpdatesEnabled(True)
 
 
 # =============================================================================
@@ -1057,13 +1533,46 @@ class ResultsPanel(QGroupBox):
 # VENTANA PRINCIPAL
 # =============================================================================
 
+class SimulationWorker(QObject):
+    """Ejecuta el calculo de la simulacion fuera del hilo de la interfaz."""
+
+    finished = Signal(int, object, object, object)  # id, Resultados, t, vout
+    failed = Signal(int, str)
+
+    @Slot(int, object, object)
+    def run(self, run_id: int, carga: ConfigCarga, senal: ConfigSenal):
+        """
+        Calcula la respuesta y la senal en el tiempo. run_id se devuelve
+        tal cual para que la ventana descarte respuestas obsoletas.
+        """
+        try:
+            resultados = calcular_respuesta(carga, senal)
+            # Los arreglos cacheados son de solo lectura, asi que la grafica
+            # puede seguir usandolos mientras se calcula la siguiente
+            # simulacion
+            t, vout = generar_senal_tiempo(
+                senal.dc, resultados.frecuencias,
+                resultados.voltajes_rms, resultados.fases_rad
+            )
+        except Exception as e:
+            self.failed.emit(run_id, str(e))
+            return
+        self.finished.emit(run_id, resultados, t, vout)
+
+
 class MainWindow(QMainWindow):
     """Ventana principal del simulador."""
 
+    simulation_requested = Signal(int, object, object)  # id, ConfigCarga, ConfigSenal
+
     def __init__(self):
         super().__init__()
+        # Identifica la simulacion vigente; _reset lo avanza para que se
+        # descarte la respuesta de una simulacion lanzada antes
+        self._run_id = 0
         self._setup_ui()
         self._setup_menu()
+        self._setup_worker()
         self._connect_signals()
 
     def _setup_ui(self):
@@ -1108,7 +1617,7 @@ class MainWindow(QMainWindow):
         self.results_panel = ResultsPanel()
         self.results_panel.setMaximumHeight(180)
 
-        self.plot_canvas = PlotCanvas()
+        self.plot_canvas = crear_plot_canvas()
         self.plot_canvas.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
@@ -1153,44 +1662,65 @@ class MainWindow(QMainWindow):
         action_acerca.triggered.connect(self._show_about)
         ayuda_menu.addAction(action_acerca)
 
+    def _setup_worker(self):
+        """Crea el hilo de calculo y su trabajador."""
+        self._thread = QThread(self)
+        self._worker = SimulationWorker()
+        self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
+
     def _connect_signals(self):
         """Conecta las senales y slots."""
         self.btn_simular.clicked.connect(self._run_simulation)
+        self.simulation_requested.connect(self._worker.run)
+        self._worker.finished.connect(self._on_simulation_finished)
+        self._worker.failed.connect(self._on_simulation_failed)
 
+    @Slot()
     def _run_simulation(self):
-        """Ejecuta la simulacion con los parametros actuales."""
-        try:
-            # Obtener configuraciones
-            carga = self.load_panel.get_config()
-            senal = self.signal_panel.get_config()
+        """Lanza la simulacion con los parametros actuales."""
+        # Obtener configuraciones
+        carga = self.load_panel.get_config()
+        senal = self.signal_panel.get_config()
 
-            # Validar entradas
-            if not self._validate_inputs(senal):
-                return
+        # Validar entradas
+        if not self._validate_inputs(senal):
+            return
 
-            self.status_bar.showMessage("Simulando...")
-            QApplication.processEvents()
+        self.btn_simular.setEnabled(False)
+        self.status_bar.showMessage("Simulando...")
+        self._run_id += 1
+        self.simulation_requested.emit(self._run_id, carga, senal)
 
-            # Ejecutar calculo
-            resultados = calcular_respuesta(carga, senal)
+    @Slot(int, object, object, object)
+    def _on_simulation_finished(self, run_id: int, resultados: Resultados,
+                                t: np.ndarray, vout: np.ndarray):
+        """Muestra los resultados calculados por el trabajador."""
+        if run_id != self._run_id:  # Obsoleta: hubo un reinicio
+            return
 
-            # Generar senal en el tiempo
-            t, vout = generar_senal_tiempo(senal.dc, resultados.componentes)
+        # Actualizar grafica
+        self.plot_canvas.plot_signal(t, vout)
 
-            # Actualizar grafica
-            self.plot_canvas.plot_signal(t, vout)
+        # Mostrar resultados
+        self.results_panel.display_results(resultados)
 
-            # Mostrar resultados
-            self.results_panel.display_results(resultados)
+        self.status_bar.showMessage("Simulacion completada")
+        self.btn_simular.setEnabled(True)
 
-            self.status_bar.showMessage("Simulacion completada")
+    @Slot(int, str)
+    def _on_simulation_failed(self, run_id: int, mensaje: str):
+        """Informa un error ocurrido durante la simulacion."""
+        if run_id != self._run_id:  # Obsoleta: hubo un reinicio
+            return
 
-        except Exception as e:
-            self.status_bar.showMessage(f"Error: {str(e)}")
-            QMessageBox.critical(
-                self, "Error de simulacion",
-                f"Ocurrio un error durante la simulacion:\n{str(e)}"
-            )
+        self.status_bar.showMessage(f"Error: {mensaje}")
+        self.btn_simular.setEnabled(True)
+        QMessageBox.critical(
+            self, "Error de simulacion",
+            f"Ocurrio un error durante la simulacion:\n{mensaje}"
+        )
 
     def _validate_inputs(self, senal: ConfigSenal) -> bool:
         """Valida los datos de entrada."""
@@ -1211,14 +1741,26 @@ class MainWindow(QMainWindow):
 
         return True
 
+    @Slot()
     def _reset(self):
         """Reinicia la simulacion."""
+        # Descartar la simulacion en curso, si la hay
+        self._run_id += 1
+        self.btn_simular.setEnabled(True)
+
         self.load_panel.reset()
         self.signal_panel.reset()
         self.results_panel.clear()
         self.plot_canvas.clear()
         self.status_bar.showMessage("Listo para simular")
 
+    def closeEvent(self, event):
+        """Detiene el hilo de calculo al cerrar la ventana."""
+        self._thread.quit()
+        self._thread.wait()
+        super().closeEvent(event)
+
+    @Slot()
     def _show_about(self):
         """Muestra el dialogo Acerca de."""
         QMessageBox.about(
@@ -1248,6 +1790,10 @@ def main():
     app.setOrganizationName("ITCR")
     app.setApplicationVersion("1.0.0")
 
+    # Locale C compartido por todos los spinboxes: punto decimal y sin
+    # separadores de miles al formatear y validar
+    QLocale.setDefault(QLocale.c())
+
     # Cargar icono de la aplicacion
     icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.png")
     if os.path.exists(icon_path):